@@ -1,320 +1,479 @@
 #!/usr/bin/env python3
+import re
 import sys
-import os
-import json
-import csv
-import secrets
-import string
-from cryptography.fernet import Fernet
+from itertools import islice
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QHBoxLayout, QLabel, QPushButton, QLineEdit,
-                           QTextEdit, QMessageBox, QFileDialog, QSpinBox,
-                           QFrame, QGridLayout, QScrollArea, QComboBox, QDialog,
-                           QTableWidget, QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap
-
-
-class PasswordManager:
-    def __init__(self, file_path=None):
-        if file_path is None:
-            # Use cross-platform path for both Windows and Linux
-            file_path = os.path.join(os.path.expanduser('~'), '.passmanager', 'passwords.json')
-        self.file_path = file_path
-        self.key = self.load_key()
-        self.fernet = Fernet(self.key)
-        self.passwords = self.load_passwords()
-        # Default categories with meaningful names
-        self.categories = ["Internet", "Gaming", "Coding", "Shopping", "Social", "Computer", "World"]
-        if "categories" not in self.passwords:
-            self.passwords["categories"] = {}
-            for category in self.categories:
-                self.passwords["categories"][category] = {}
-            self.save_passwords()
-        
-        # Check if migration is needed
-        self.check_and_migrate_categories()
-
-    def load_key(self):
-        # Use cross-platform path for both Windows and Linux
-        key_path = os.path.join(os.path.expanduser('~'), '.passmanager', 'secret.key')
-        os.makedirs(os.path.dirname(key_path), exist_ok=True)
-        if os.path.exists(key_path):
-            with open(key_path, 'rb') as key_file:
-                return key_file.read()
-        else:
-            key = Fernet.generate_key()
-            with open(key_path, 'wb') as key_file:
-                key_file.write(key)
-            # Use platform-neutral way to set permissions
-            try:
-                os.chmod(key_path, 0o600)  # Set permissions to read/write for owner only
-            except Exception:
-                # On Windows, chmod doesn't fully work, but it's OK
-                pass
-            return key
-
-    def load_passwords(self):
-        if os.path.exists(self.file_path):
-            with open(self.file_path, 'rb') as file:
-                encrypted_data = file.read()
-                decrypted_data = self.fernet.decrypt(encrypted_data).decode()
-                return json.loads(decrypted_data)
-        return {}
-
-    def save_passwords(self):
-        encrypted_data = self.fernet.encrypt(json.dumps(self.passwords).encode('utf-8'))
-        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-        with open(self.file_path, 'wb') as file:
-            file.write(encrypted_data)
-
-    def check_and_migrate_categories(self):
-        """Check if categories need migration and migrate them"""
-        # Old and new categories
-        old_categories = ["1", "2", "3", "4"]
-        
-        # Check if migration is needed
-        needs_migration = False
-        for old_cat in old_categories:
-            if old_cat in self.passwords["categories"]:
-                needs_migration = True
-                break
-        
-        if needs_migration:
-            self.migrate_categories()
-    
-    def migrate_categories(self):
-        """Migrate old numeric categories to new named ones"""
-        old_categories = ["1", "2", "3", "4"]
-        new_categories = ["Internet", "Gaming", "Coding", "Shopping", "Social", "Computer", "World"]
-        
-        # First make sure all new categories exist
-        for new_cat in new_categories:
-            if new_cat not in self.passwords["categories"]:
-                self.passwords["categories"][new_cat] = {}
-        
-        # Copy data from old categories to new ones if old categories exist
-        for i, old_cat in enumerate(old_categories):
-            if old_cat in self.passwords["categories"] and i < len(new_categories):
-                new_cat = new_categories[i]
-                # Copy passwords from old category to new category
-                for service, data in self.passwords["categories"][old_cat].items():
-                    self.passwords["categories"][new_cat][service] = data
-                # Remove old category using pop to avoid KeyError if not present
-                self.passwords["categories"].pop(old_cat, None)
-        
-        self.save_passwords()
-
-    def add_password(self, service, username, password, category="Internet", tags=None):
-        if category not in self.passwords["categories"]:
-            self.passwords["categories"][category] = {}
-        
-        # Initialize tags if not provided
-        if tags is None:
-            tags = []
-        
-        self.passwords["categories"][category][service] = {
-            'username': username, 
-            'password': password,
-            'tags': tags
-        }
-        self.save_passwords()
-
-    def get_password(self, service, category=None):
-        if category:
-            if category in self.passwords["categories"] and service in self.passwords["categories"][category]:
-                return self.passwords["categories"][category][service]
-        else:
-            # Search in all categories
-            for cat, services in self.passwords["categories"].items():
-                if service in services:
-                    return services[service]
-        return None
+                           QPlainTextEdit, QMessageBox, QFileDialog, QSpinBox,
+                           QFrame, QComboBox, QDialog, QFormLayout, QTableView,
+                           QAbstractItemView, QListWidget, QListWidgetItem, QCompleter)
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal,
+                          QAbstractTableModel, QModelIndex, QStringListModel)
+from PyQt5.QtGui import QPalette, QColor, QCursor, QClipboard
+from passmanager_core import PasswordManager
 
-    def update_password(self, service, username, password, category=None, tags=None):
-        # Preserve existing tags if not provided
-        existing_tags = []
-        
-        if category:
-            if category in self.passwords["categories"] and service in self.passwords["categories"][category]:
-                # Keep existing tags if not provided
-                if tags is None and 'tags' in self.passwords["categories"][category][service]:
-                    existing_tags = self.passwords["categories"][category][service]['tags']
-                
-                self.passwords["categories"][category][service] = {
-                    'username': username, 
-                    'password': password,
-                    'tags': tags if tags is not None else existing_tags
-                }
-                self.save_passwords()
-                return True
-        else:
-            # Search and update in all categories
-            for cat, services in self.passwords["categories"].items():
-                if service in services:
-                    # Keep existing tags if not provided
-                    if tags is None and 'tags' in services[service]:
-                        existing_tags = services[service]['tags']
-                    
-                    services[service] = {
-                        'username': username, 
-                        'password': password,
-                        'tags': tags if tags is not None else existing_tags
-                    }
-                    self.save_passwords()
-                    return True
-        return False
-
-    def delete_password(self, service, category=None):
-        """Delete a password entry
-        
-        Args:
-            service: The service name to delete
-            category: The category containing the service, or None to search all categories
-            
-        Returns:
-            True if deletion was successful, False otherwise
-        """
-        if category:
-            # Delete from specific category
-            if category in self.passwords["categories"] and service in self.passwords["categories"][category]:
-                del self.passwords["categories"][category][service]
-                self.save_passwords()
-                return True
-        else:
-            # Search in all categories
-            for cat, services in self.passwords["categories"].items():
-                if service in services:
-                    del self.passwords["categories"][cat][service]
-                    self.save_passwords()
-                    return True
-        return False
-
-    def search_password(self, keyword, category=None, tag=None):
-        results = {}
-        if category:
-            if category in self.passwords["categories"]:
-                cat_services = self.passwords["categories"][category]
-                for service, creds in cat_services.items():
-                    # Check if the keyword matches the service name
-                    keyword_match = keyword.lower() in service.lower()
-                    
-                    # Check if tag filter is applied and matches
-                    tag_match = True
-                    if tag:
-                        tag_match = False
-                        if 'tags' in creds and creds['tags']:
-                            tag_match = tag.lower() in [t.lower() for t in creds['tags']]
-                    
-                    if keyword_match and tag_match:
-                        results[service] = creds
-        else:
-            # Search in all categories
-            for cat, services in self.passwords["categories"].items():
-                for service, creds in services.items():
-                    # Check if the keyword matches the service name
-                    keyword_match = keyword.lower() in service.lower()
-                    
-                    # Check if tag filter is applied and matches
-                    tag_match = True
-                    if tag:
-                        tag_match = False
-                        if 'tags' in creds and creds['tags']:
-                            tag_match = tag.lower() in [t.lower() for t in creds['tags']]
-                    
-                    if keyword_match and tag_match:
-                        results[service] = creds
-        return results
+# Application-wide style, it also covers dialogs so no white areas show
+APP_STYLE = """
+    QMainWindow, QDialog, QWidget {
+        background-color: #1a1a1a;
+        color: white;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #1a1a1a;
+        width: 8px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #3d3d3d;
+        min-height: 20px;
+        border-radius: 4px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar:horizontal {
+        border: none;
+        background: #1a1a1a;
+        height: 8px;
+        margin: 0px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #3d3d3d;
+        min-width: 20px;
+        border-radius: 4px;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+"""
 
-    def get_categories(self):
-        return list(self.passwords["categories"].keys())
+# Separator lines in the password listing
+CATEGORY_SEPARATOR = "-" * 40
+ENTRY_SEPARATOR = "-" * 30
 
-    def import_passwords(self, csv_file):
-        try:
-            with open(csv_file, 'r') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    service = row['service']
-                    username = row['username']
-                    password = row['password']
-                    category = row.get('category', '1')  # Default to category 1 if not specified
-                    self.add_password(service, username, password, category)
-            return True
-        except Exception as e:
-            print(f"Error importing passwords: {e}")
-            return False
+# Entries appended to the listing per event loop pass, about 1000 lines
+LISTING_BATCH = 250
+
+# Style for the sidebar and its menu buttons
+SIDEBAR_STYLE = """
+    #sidebar, #sidebar QWidget {
+        background-color: #1a1a1a;
+        border-right: 1px solid #333333;
+    }
+    #sidebar QPushButton {
+        background-color: #2d2d2d;
+        color: white;
+        border: none;
+        padding: 10px;
+        border-radius: 5px;
+        font-weight: bold;
+        font-size: 12px;
+        text-align: left;
+        margin: 2px 0px;
+    }
+    #sidebar QPushButton:hover {
+        background-color: #3d3d3d;
+        border-left: 3px solid #42d4d4;
+        color: #42d4d4;
+    }
+    #sidebar QPushButton:pressed {
+        background-color: #1d1d1d;
+    }
+    #sidebar QPushButton:disabled {
+        background-color: #1d1d1d;
+        color: #666666;
+    }
+"""
+
+# Style for the main output pane
+OUTPUT_STYLE = """
+    QPlainTextEdit#output {
+        background-color: #2d2d2d;
+        color: white;
+        border: 1px solid #3d3d3d;
+        border-radius: 5px;
+        padding: 10px;
+        font-family: 'Consolas', monospace;
+        font-size: 12px;
+        line-height: 1.5;
+        margin-top: 15px;
+    }
+    #output QScrollBar:vertical {
+        border: none;
+        background-color: #2d2d2d;
+        width: 8px;
+        margin: 0px;
+    }
+    #output QScrollBar::handle:vertical {
+        background-color: #42d4d4;
+        border-radius: 4px;
+        min-height: 20px;
+    }
+    #output QScrollBar::handle:vertical:hover {
+        background-color: #3d3d3d;
+    }
+    #output QScrollBar::add-line:vertical,
+    #output QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+"""
+
+# Style for the welcome message above the output pane
+HEADER_STYLE = """
+    QLabel#welcomeLabel {
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    QLabel#instructionsLabel {
+        color: #cccccc;
+        font-size: 12px;
+    }
+"""
+
+# Style for the password security check dialog
+SECURITY_DIALOG_STYLE = """
+    QDialog#securityDialog {
+        background-color: #1a1a1a;
+    }
+    #securityDialog QLabel {
+        color: white;
+    }
+    #securityDialog QLabel#securityTitle {
+        font-size: 18px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    #securityDialog QFrame#strengthMeter {
+        background-color: #2d2d2d;
+        border-radius: 4px;
+    }
+    #securityDialog QFrame#strengthBar {
+        background-color: #666;
+        border-radius: 2px;
+    }
+    #securityDialog QLabel#securityResult {
+        background-color: #2d2d2d;
+        padding: 15px;
+        border-radius: 4px;
+        min-height: 80px;
+    }
+    #securityDialog QLineEdit {
+        background-color: #2d2d2d;
+        color: white;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 6px;
+    }
+    #securityDialog QPushButton {
+        background-color: #2d2d2d;
+        color: white;
+        border: none;
+        padding: 8px;
+        border-radius: 4px;
+    }
+    #securityDialog QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #42d4d4;
+        color: #42d4d4;
+    }
+"""
+
+# Style for the password dialogs. It is part of the application style sheet
+# and applies to every dialog whose object name is DIALOG_OBJECT_NAME.
+DIALOG_OBJECT_NAME = "pmDialog"
+DIALOG_STYLE = """
+    QDialog#pmDialog {
+        background-color: #1a1a1a;
+    }
+    #pmDialog QLabel {
+        color: white;
+        font-size: 11px;
+    }
+    #pmDialog QLabel#warningLabel {
+        color: #ff5555;
+        font-weight: bold;
+    }
+    #pmDialog QLabel#resultsLabel {
+        margin-top: 10px;
+    }
+    #pmDialog QLineEdit, #pmDialog QComboBox, #pmDialog QSpinBox {
+        background-color: #2d2d2d;
+        color: white;
+        border: 1px solid #3d3d3d;
+        border-radius: 3px;
+        padding: 4px;
+        font-size: 11px;
+    }
+    #pmDialog QLineEdit:focus, #pmDialog QComboBox:focus, #pmDialog QSpinBox:focus {
+        border: 1px solid #42d4d4;
+    }
+    #pmDialog QPushButton {
+        background-color: #2d2d2d;
+        color: white;
+        border: none;
+        padding: 5px;
+        border-radius: 3px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+    #pmDialog QPushButton:hover {
+        background-color: #3d3d3d;
+        border: 1px solid #42d4d4;
+        color: #42d4d4;
+    }
+    #pmDialog QComboBox::drop-down {
+        border: 0px;
+    }
+    #pmDialog QComboBox QAbstractItemView {
+        background-color: #2d2d2d;
+        color: white;
+        selection-background-color: #3d3d3d;
+        selection-color: #42d4d4;
+    }
+    #pmDialog QTableView, #pmDialog QListWidget {
+        background-color: #2d2d2d;
+        color: white;
+        border: 1px solid #3d3d3d;
+        gridline-color: #3d3d3d;
+        selection-background-color: #3d3d3d;
+        selection-color: #42d4d4;
+        font-size: 11px;
+    }
+    #pmDialog QHeaderView::section {
+        background-color: #1a1a1a;
+        color: white;
+        border: none;
+        border-bottom: 1px solid #3d3d3d;
+        padding: 4px;
+        font-weight: bold;
+        font-size: 11px;
+    }
+"""
+
+# Complete application style sheet, installed once by main()
+STYLE_SHEET = (APP_STYLE + SIDEBAR_STYLE + OUTPUT_STYLE + HEADER_STYLE
+               + SECURITY_DIALOG_STYLE + DIALOG_STYLE)
 
-    def export_passwords(self, csv_file):
+
+_dark_palette = None
+
+
+def dark_palette():
+    """Return the shared dark palette, building it on first use"""
+    # Built lazily because Qt palettes need a running QApplication
+    global _dark_palette
+    if _dark_palette is None:
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor(26, 26, 26))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Base, QColor(45, 45, 45))
+        palette.setColor(QPalette.AlternateBase, QColor(35, 35, 35))
+        palette.setColor(QPalette.ToolTipBase, Qt.white)
+        palette.setColor(QPalette.ToolTipText, Qt.white)
+        palette.setColor(QPalette.Text, Qt.white)
+        palette.setColor(QPalette.Button, QColor(45, 45, 45))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        _dark_palette = palette
+    return _dark_palette
+
+
+# How long the GUI waits after an edit before saving, in milliseconds
+SAVE_DELAY_MS = 500
+
+# Copied passwords are removed from the clipboard after this many milliseconds
+CLIPBOARD_CLEAR_MS = 30000
+
+# How long the Copy button shows that the copy worked, in milliseconds
+COPIED_FEEDBACK_MS = 1500
+
+# The search dialog updates its results once typing pauses for this long
+SEARCH_DELAY_MS = 150
+
+# Weak substrings the strength check penalizes, matched case-insensitively
+# by one compiled pattern so the whole list is found in a single scan
+COMMON_PATTERNS = ('123456', 'password', 'qwerty', 'admin')
+COMMON_PATTERN_RE = re.compile('|'.join(map(re.escape, COMMON_PATTERNS)))
+
+# One comma separated tag, without the whitespace around it
+TAG_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+
+def parse_tags(text):
+    """Split comma separated tags, dropping surrounding whitespace and empty tags"""
+    return TAG_RE.findall(text) if text else []
+
+
+class TaskSignals(QObject):
+    """Delivers a background task's result back to the GUI thread"""
+    finished = pyqtSignal(object)
+
+
+class SaveTask(QRunnable):
+    """Writes a vault snapshot off the GUI thread
+
+    signals.finished carries None once the snapshot is saved, or the error
+    that stopped it.
+    """
+
+    def __init__(self, password_manager, snapshot, signals):
+        super().__init__()
+        self.password_manager = password_manager
+        self.snapshot = snapshot
+        self.signals = signals
+
+    def run(self):
         try:
-            with open(csv_file, 'w', newline='') as file:
-                fieldnames = ['category', 'service', 'username', 'password']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for category, services in self.passwords["categories"].items():
-                    for service, creds in services.items():
-                        writer.writerow({
-                            'category': category,
-                            'service': service, 
-                            'username': creds['username'], 
-                            'password': creds['password']
-                        })
-            return True
+            self.password_manager.write_snapshot(self.snapshot)
         except Exception as e:
-            print(f"Error exporting passwords: {e}")
-            return False
+            print(f"Error saving passwords: {e}")
+            self.signals.finished.emit(e)
+        else:
+            self.signals.finished.emit(None)
+
+
+class BackgroundTask(QRunnable):
+    """Runs a password manager call off the GUI thread and reports its result"""
+
+    def __init__(self, function, *args):
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.signals = TaskSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.function(*self.args))
+
+
+class ResultsModel(QAbstractTableModel):
+    """Table of search results, the view only asks for the rows it shows"""
+
+    HEADERS = ("Service", "Category", "Username", "Password", "Tags")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+
+    def set_rows(self, rows):
+        """Replace the results with a list of (category, service, entry) tuples"""
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        category, service, info = self.rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return service
+        if column == 1:
+            return category
+        if column == 2:
+            return info['username']
+        if column == 3:
+            return info['password']
+        return ', '.join(info.get('tags') or ())
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
 
-    def generate_password(self, length=12):
-        characters = string.ascii_letters + string.digits + string.punctuation
-        password = ''.join(secrets.choice(characters) for i in range(length))
-        return password
 
 class PasswordManagerGUI(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.password_manager = PasswordManager()
+        # Changes are written by the save thread instead of inside each mutation
+        self.password_manager = PasswordManager(autosave=False)
+        # A single thread keeps saves in order. Imports and exports run on it
+        # too, so they never overlap with a save
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        # Rapid successive edits are coalesced into one save
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.save_now)
+        # Shared by all save tasks, it outlives each task's runnable
+        self.save_signals = TaskSignals(self)
+        self.save_signals.finished.connect(self._save_finished)
+        # Dialogs are built on first use and reused afterwards
+        self._dialogs = {}
+        # Background import or export that is still running
+        self._task = None
+        # Generator of the password listing while it is being shown
+        self._listing = None
+        self.clipboard = QApplication.clipboard()
         self.setup_ui()
         
+    def schedule_save(self):
+        """Save pending vault changes once edits have settled"""
+        self.save_timer.start()
+
+    def save_now(self):
+        """Encrypt and write pending vault changes on the save thread"""
+        self.save_timer.stop()
+        snapshot = self.password_manager.take_pending_snapshot()
+        if snapshot is not None:
+            self.save_pool.start(SaveTask(self.password_manager, snapshot, self.save_signals))
+
+    def _save_finished(self, error):
+        # The changes stay pending after a failure and are retried by the
+        # next save, the user just needs to know they are not on disk yet
+        if error is not None:
+            self.show_output(f"Error saving passwords: {error}\n"
+                             "Your changes are kept and will be saved again with the next change.")
+
+    def run_task(self, message, on_finished, function, *args):
+        """Run function(*args) on the save thread with the menu disabled
+
+        on_finished is called on the GUI thread with the function's result.
+        """
+        # Queue pending edits first, the menu stays disabled until the task
+        # is done so nothing touches the vault while it runs
+        self.save_now()
+        self.sidebar.setEnabled(False)
+        self.show_output(message)
+
+        def finished(result):
+            self._task = None
+            self.sidebar.setEnabled(True)
+            on_finished(result)
+
+        self._task = BackgroundTask(function, *args)
+        self._task.signals.finished.connect(finished)
+        self.save_pool.start(self._task)
+
+    def copy_to_clipboard(self, text):
+        """Copy text to the clipboard and clear it again after a while"""
+        self.clipboard.setText(text, QClipboard.Clipboard)
+        QTimer.singleShot(CLIPBOARD_CLEAR_MS, lambda: self._clear_clipboard(text))
+
+    def _clear_clipboard(self, text):
+        # Leave the clipboard alone if something else was copied since
+        if self.clipboard.text(QClipboard.Clipboard) == text:
+            self.clipboard.clear(QClipboard.Clipboard)
+
+    def closeEvent(self, event):
+        # Let queued saves finish and write anything still pending
+        self.save_timer.stop()
+        self.save_pool.waitForDone()
+        self.password_manager.close()
+        super().closeEvent(event)
+
     def setup_ui(self):
         self.setWindowTitle("Securonis Password Manager")
         self.setGeometry(100, 100, 700, 500)
         
-        # Set application-wide style to eliminate white spaces
-        app = QApplication.instance()
-        app.setStyleSheet("""
-            QMainWindow, QDialog, QWidget {
-                background-color: #1a1a1a;
-                color: white;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #1a1a1a;
-                width: 8px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #3d3d3d;
-                min-height: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #1a1a1a;
-                height: 8px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #3d3d3d;
-                min-width: 20px;
-                border-radius: 4px;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-        """)
-        
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QHBoxLayout(central_widget)
@@ -323,43 +482,13 @@ class PasswordManagerGUI(QMainWindow):
         
         # Left sidebar for buttons
         sidebar = QWidget()
+        self.sidebar = sidebar
+        sidebar.setObjectName("sidebar")
         sidebar.setFixedWidth(180)
-        sidebar.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                border-right: 1px solid #333333;
-            }
-        """)
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setSpacing(8)
         sidebar_layout.setContentsMargins(10, 20, 10, 20)
         
-        # Modern button style
-        button_style = """
-            QPushButton {
-                background-color: #2d2d2d;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-weight: bold;
-                font-size: 12px;
-                text-align: left;
-                margin: 2px 0px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border-left: 3px solid #42d4d4;
-                color: #42d4d4;
-            }
-            QPushButton:pressed {
-                background-color: #1d1d1d;
-            }
-            QPushButton:disabled {
-                background-color: #1d1d1d;
-                color: #666666;
-            }
-        """
         
         # No title for sidebar as requested
         
@@ -378,10 +507,10 @@ class PasswordManagerGUI(QMainWindow):
         ]
 
         # Add buttons vertically in the sidebar
+        cursor = QCursor(Qt.PointingHandCursor)
         for text, callback in menu_buttons:
             btn = QPushButton(text)
-            btn.setStyleSheet(button_style)
-            btn.setCursor(Qt.PointingHandCursor)
+            btn.setCursor(cursor)
             btn.clicked.connect(callback)
             sidebar_layout.addWidget(btn)
         
@@ -391,40 +520,14 @@ class PasswordManagerGUI(QMainWindow):
         # Add sidebar to main layout
         main_layout.addWidget(sidebar)
 
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        # Output is only ever replaced or appended, keeping undo history for
+        # it would just hold on to old listings
+        self.output_text.setUndoRedoEnabled(False)
+        self.output_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.output_text.setMinimumHeight(250)
-        self.output_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 5px;
-                padding: 10px;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-                line-height: 1.5;
-                margin-top: 15px;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background-color: #2d2d2d;
-                width: 8px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #42d4d4;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #3d3d3d;
-            }
-            QScrollBar::add-line:vertical,
-            QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.output_text.setObjectName("output")
         
         # Content area
         content_area = QWidget()
@@ -433,19 +536,12 @@ class PasswordManagerGUI(QMainWindow):
         
         # Welcome message
         welcome_label = QLabel("Welcome to Securonis Password Manager")
-        welcome_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-        """)
+        welcome_label.setObjectName("welcomeLabel")
         content_layout.addWidget(welcome_label)
         
         # Instructions
         instructions = QLabel("Select an option from the menu on the left to manage your passwords.")
-        instructions.setStyleSheet("color: #cccccc; font-size: 12px;")
+        instructions.setObjectName("instructionsLabel")
         content_layout.addWidget(instructions)
         
         # Output text area
@@ -456,239 +552,169 @@ class PasswordManagerGUI(QMainWindow):
         
         self.set_dark_theme()
         
+    def show_output(self, text):
+        """Replace the contents of the output pane"""
+        # Stop a listing that is still being appended
+        self._listing = None
+        self.output_text.setPlainText(text)
+
     def set_dark_theme(self):
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(26, 26, 26))
-        palette.setColor(QPalette.WindowText, Qt.white)
-        palette.setColor(QPalette.Base, QColor(45, 45, 45))
-        palette.setColor(QPalette.AlternateBase, QColor(35, 35, 35))
-        palette.setColor(QPalette.ToolTipBase, Qt.white)
-        palette.setColor(QPalette.ToolTipText, Qt.white)
-        palette.setColor(QPalette.Text, Qt.white)
-        palette.setColor(QPalette.Button, QColor(45, 45, 45))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        self.setPalette(palette)
-        
+        self.setPalette(dark_palette())
+        
+    def _show_dialog(self, name, build):
+        """Show a dialog, building it on first use and resetting it afterwards"""
+        dialog = self._dialogs.get(name)
+        if dialog is None:
+            dialog = build()
+            self._dialogs[name] = dialog
+        dialog.reset()
+        dialog.exec_()
+
+    def _fill_category_combo(self, combo, include_all=False):
+        """Populate a category combo box with the current categories"""
+        combo.clear()
+        if include_all:
+            combo.addItem("All Categories")
+        combo.addItems(self.password_manager.get_categories())
+
     def show_add_password(self):
-        dialog = QWidget()
-        dialog.setWindowTitle("Add Password")
-        dialog.setGeometry(200, 200, 400, 330)  # Increased height for tags
-        dialog.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: white;
-                font-size: 12px;
-            }
-            QLineEdit, QComboBox {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-                font-size: 12px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border: 1px solid #42d4d4;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #42d4d4;
-                color: #42d4d4;
-            }
-            QComboBox::drop-down {
-                border: 0px;
-            }
-            QComboBox::down-arrow {
-                image: url(down_arrow.png);
-                width: 12px;
-                height: 12px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: white;
-                selection-background-color: #3d3d3d;
-                selection-color: #42d4d4;
-            }
-        """)
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(10)
-        layout.setContentsMargins(15, 15, 15, 15)
+        self._show_dialog('add', self._build_add_password_dialog)
+
+    def show_get_password(self):
+        self._show_dialog('get', self._build_get_password_dialog)
+
+    def show_search_password(self):
+        self._show_dialog('search', self._build_search_password_dialog)
+
+    def show_delete_password(self):
+        self._show_dialog('delete', self._build_delete_password_dialog)
+
+    def show_update_password(self):
+        self._show_dialog('update', self._build_update_password_dialog)
+
+    def _build_form_dialog(self, title, size, fields, submit_label, on_submit,
+                           category_label="Category (optional):", include_all=True, warning=None,
+                           complete_services=False):
+        """Build a form dialog with a category combo followed by line edits
+
+        fields is a list of (name, label, placeholder) tuples; the field named
+        'password' is masked. on_submit is called with a dict of the field
+        texts, the selected category (None for "All Categories") and the dialog.
+        With complete_services the 'service' field suggests the services of
+        the selected category.
+        """
+        dialog = QDialog(self)
+        dialog.setWindowTitle(title)
+        dialog.setGeometry(200, 200, *size)
+        dialog.setObjectName(DIALOG_OBJECT_NAME)
+        layout = QFormLayout(dialog)
+        layout.setSpacing(5)
+        layout.setContentsMargins(10, 10, 10, 10)
 
-        category_label = QLabel("Category:")
         category_combo = QComboBox()
-        for category in self.password_manager.get_categories():
-            category_combo.addItem(category)
-        
-        service_label = QLabel("Service Name:")
-        service_input = QLineEdit()
-        service_input.setPlaceholderText("Enter service name")
-        
-        username_label = QLabel("Username:")
-        username_input = QLineEdit()
-        username_input.setPlaceholderText("Enter username")
-        
-        password_label = QLabel("Password:")
-        password_input = QLineEdit()
-        password_input.setPlaceholderText("Enter password")
-        password_input.setEchoMode(QLineEdit.Password)
-        
-        # Add tags field
-        tags_label = QLabel("Tags (comma separated):")
-        tags_input = QLineEdit()
-        tags_input.setPlaceholderText("e.g., work, personal, important")
-        
-        layout.addWidget(category_label)
-        layout.addWidget(category_combo)
-        layout.addWidget(service_label)
-        layout.addWidget(service_input)
-        layout.addWidget(username_label)
-        layout.addWidget(username_input)
-        layout.addWidget(password_label)
-        layout.addWidget(password_input)
-        layout.addWidget(tags_label)
-        layout.addWidget(tags_input)
-        
+        layout.addRow(QLabel(category_label), category_combo)
+
+        inputs = {}
+        for name, label, placeholder in fields:
+            field = QLineEdit()
+            field.setPlaceholderText(placeholder)
+            if name == 'password':
+                field.setEchoMode(QLineEdit.Password)
+            layout.addRow(QLabel(label), field)
+            inputs[name] = field
+
+        if complete_services:
+            # Qt does the matching, the model is refilled when the category changes
+            service_model = QStringListModel(dialog)
+            completer = QCompleter(service_model, dialog)
+            completer.setCaseSensitivity(Qt.CaseInsensitive)
+            inputs['service'].setCompleter(completer)
+
+            def fill_services():
+                category = category_combo.currentText()
+                if include_all and category == "All Categories":
+                    category = None
+                service_model.setStringList(self.password_manager.list_services(category))
+
+            category_combo.currentIndexChanged.connect(fill_services)
+
+        if warning:
+            warning_label = QLabel(warning)
+            warning_label.setObjectName("warningLabel")
+            layout.addRow(warning_label)
+
         button_layout = QHBoxLayout()
-        save_btn = QPushButton("Save")
+        submit_btn = QPushButton(submit_label)
         cancel_btn = QPushButton("Cancel")
-        
-        save_btn.clicked.connect(lambda: self.add_password(
-            service_input.text(),
-            username_input.text(),
-            password_input.text(),
-            category_combo.currentText(),
-            tags_input.text(),
-            dialog
-        ))
-        cancel_btn.clicked.connect(dialog.close)
-        
-        button_layout.addWidget(save_btn)
+
+        def submit():
+            category = category_combo.currentText()
+            if include_all and category == "All Categories":
+                category = None
+            values = {name: field.text() for name, field in inputs.items()}
+            on_submit(values, category, dialog)
+
+        submit_btn.clicked.connect(submit)
+        cancel_btn.clicked.connect(dialog.reject)
+
+        button_layout.addWidget(submit_btn)
         button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
-        
-        dialog.show()
-        
+        layout.addRow(button_layout)
+
+        def reset():
+            self._fill_category_combo(category_combo, include_all)
+            for field in inputs.values():
+                field.clear()
+            if complete_services:
+                # The services may have changed even if the category did not
+                fill_services()
+
+        dialog.reset = reset
+        return dialog
+
+    def _build_add_password_dialog(self):
+        dialog = self._build_form_dialog(
+            "Add Password", (400, 330),
+            [('service', "Service Name:", "Enter service name"),
+             ('username', "Username:", "Enter username"),
+             ('password', "Password:", "Enter password"),
+             ('tags', "Tags (comma separated):", "e.g., work, personal, important")],
+            "Save",
+            lambda values, category, dialog: self.add_password(
+                values['service'], values['username'], values['password'],
+                category, values['tags'], dialog),
+            category_label="Category:", include_all=False)
+        dialog.layout().setSpacing(10)
+        dialog.layout().setContentsMargins(15, 15, 15, 15)
+        return dialog
+
     def add_password(self, service, username, password, category, tags, dialog):
         if not all([service, username, password]):
             QMessageBox.warning(dialog, "Error", "Please fill all fields!")
             return
         
-        # Process tags - split by comma and strip whitespace
-        tag_list = []
-        if tags:
-            tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
+        tag_list = parse_tags(tags)
         
         self.password_manager.add_password(service, username, password, category, tag_list)
+        self.schedule_save()
         
         # Show confirmation with tags if any were added
         if tag_list:
-            self.output_text.setText(f"Password added for service: {service} (Category: {category}, Tags: {', '.join(tag_list)})")
+            self.show_output(f"Password added for service: {service} (Category: {category}, Tags: {', '.join(tag_list)})")
         else:
-            self.output_text.setText(f"Password added for service: {service} (Category: {category})")
+            self.show_output(f"Password added for service: {service} (Category: {category})")
         
         dialog.close()
         
-    def show_get_password(self):
-        dialog = QWidget()
-        dialog.setWindowTitle("Get Password")
-        dialog.setGeometry(200, 200, 400, 200)
-        dialog.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: white;
-                font-size: 11px;
-            }
-            QLineEdit, QComboBox {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border: 1px solid #42d4d4;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: white;
-                border: none;
-                padding: 5px;
-                border-radius: 3px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #42d4d4;
-                color: #42d4d4;
-            }
-            QComboBox::drop-down {
-                border: 0px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2d2d2d;
-                color: white;
-                selection-background-color: #3d3d3d;
-                selection-color: #42d4d4;
-            }
-        """)
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(5)
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        category_label = QLabel("Category (optional):")
-        category_combo = QComboBox()
-        category_combo.addItem("All Categories")
-        for category in self.password_manager.get_categories():
-            category_combo.addItem(category)
-        
-        service_label = QLabel("Service Name:")
-        service_input = QLineEdit()
-        service_input.setPlaceholderText("Enter service name")
-        
-        # Add tag filter
-        tag_label = QLabel("Filter by tag (optional):")
-        tag_input = QLineEdit()
-        tag_input.setPlaceholderText("Enter tag to filter by")
-        
-        layout.addWidget(category_label)
-        layout.addWidget(category_combo)
-        layout.addWidget(service_label)
-        layout.addWidget(service_input)
-        layout.addWidget(tag_label)
-        layout.addWidget(tag_input)
-        
-        button_layout = QHBoxLayout()
-        get_btn = QPushButton("Get")
-        cancel_btn = QPushButton("Cancel")
-        
-        get_btn.clicked.connect(lambda: self.get_password(
-            service_input.text(), 
-            None if category_combo.currentText() == "All Categories" else category_combo.currentText(),
-            tag_input.text(),
-            dialog
-        ))
-        cancel_btn.clicked.connect(dialog.close)
-        
-        button_layout.addWidget(get_btn)
-        button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
-        
-        dialog.show()
+    def _build_get_password_dialog(self):
+        return self._build_form_dialog(
+            "Get Password", (400, 200),
+            [('service', "Service Name:", "Enter service name"),
+             ('tag', "Filter by tag (optional):", "Enter tag to filter by")],
+            "Get",
+            lambda values, category, dialog: self.get_password(
+                values['service'], category, values['tag'], dialog),
+            complete_services=True)
 
     def get_password(self, service, category, tag, dialog):
         if not service:
@@ -700,7 +726,8 @@ class PasswordManagerGUI(QMainWindow):
         
         # If found and tag is specified, check if it has the tag
         if password_info and tag:
-            if 'tags' not in password_info or tag.lower() not in [t.lower() for t in password_info['tags']]:
+            tag_lower = tag.casefold()
+            if not any(t.casefold() == tag_lower for t in password_info.get('tags', ())):
                 password_info = None  # Reset if tag doesn't match
         
         if password_info:
@@ -709,7 +736,7 @@ class PasswordManagerGUI(QMainWindow):
             if 'tags' in password_info and password_info['tags']:
                 tags_str = f"\nTags: {', '.join(password_info['tags'])}"
             
-            self.output_text.setText(f"Service: {service}\nUsername: {password_info['username']}\nPassword: {password_info['password']}{tags_str}")
+            self.show_output(f"Service: {service}\nUsername: {password_info['username']}\nPassword: {password_info['password']}{tags_str}")
         else:
             # If not found by exact match, try searching
             results = self.password_manager.search_password(service, category, tag)
@@ -724,54 +751,25 @@ class PasswordManagerGUI(QMainWindow):
                     if 'tags' in password_info and password_info['tags']:
                         tags_str = f"\nTags: {', '.join(password_info['tags'])}"
                     
-                    self.output_text.setText(f"Service: {service_name}\nUsername: {password_info['username']}\nPassword: {password_info['password']}{tags_str}")
+                    self.show_output(f"Service: {service_name}\nUsername: {password_info['username']}\nPassword: {password_info['password']}{tags_str}")
                 else:
                     # Multiple results, show a list
-                    output = "Multiple matches found:\n\n"
+                    parts = ["Multiple matches found:\n\n"]
                     for service_name, info in results.items():
                         tags_str = ""
                         if 'tags' in info and info['tags']:
                             tags_str = f" [Tags: {', '.join(info['tags'])}]"
-                        output += f"Service: {service_name}{tags_str}\n"
-                    self.output_text.setText(output)
+                        parts.append(f"Service: {service_name}{tags_str}\n")
+                    self.show_output("".join(parts))
             else:
-                self.output_text.setText("No matching services found.")
+                self.show_output("No matching services found.")
         dialog.close()
 
-    def show_search_password(self):
+    def _build_search_password_dialog(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("Search Passwords")
         dialog.setGeometry(200, 200, 450, 280)
-        dialog.setStyleSheet("""
-        QDialog {
-            background-color: #1a1a1a;
-        }
-        QLabel {
-            color: white;
-            font-size: 11px;
-        }
-        QLineEdit, QComboBox {
-            background-color: #2d2d2d;
-            color: white;
-            border: 1px solid #3d3d3d;
-            border-radius: 3px;
-            padding: 4px;
-            font-size: 11px;
-        }
-        QPushButton {
-            background-color: #2d2d2d;
-            color: white;
-            border: 1px solid #42d4d4;
-            border-radius: 3px;
-            padding: 5px;
-            font-size: 11px;
-        }
-        QPushButton:hover {
-            background-color: #3d3d3d;
-            border: 1px solid #42d4d4;
-            color: #42d4d4;
-        }
-        """)
+        dialog.setObjectName(DIALOG_OBJECT_NAME)
         
         layout = QVBoxLayout(dialog)
         layout.setSpacing(5)
@@ -785,9 +783,6 @@ class PasswordManagerGUI(QMainWindow):
         form_layout.addRow("Search Keyword:", keyword_input)
         
         category_combo = QComboBox()
-        category_combo.addItem("All Categories")
-        for category in self.password_manager.get_categories():
-            category_combo.addItem(category)
         form_layout.addRow("Category:", category_combo)
         
         tag_input = QLineEdit()
@@ -809,263 +804,192 @@ class PasswordManagerGUI(QMainWindow):
         
         # Add results area
         results_label = QLabel("Search Results:")
-        results_label.setStyleSheet("margin-top: 10px;")
+        results_label.setObjectName("resultsLabel")
         layout.addWidget(results_label)
         
-        results_text = QTextEdit()
-        results_text.setReadOnly(True)
-        results_text.setStyleSheet("background-color: #2d2d2d; color: white;")
-        layout.addWidget(results_text)
+        # Results go into a table model, only the visible rows are rendered
+        results_model = ResultsModel(dialog)
+        results_view = QTableView()
+        results_view.setModel(results_model)
+        results_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        results_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        results_view.setWordWrap(False)
+        results_view.verticalHeader().hide()
+        results_view.horizontalHeader().setStretchLastSection(True)
+        layout.addWidget(results_view)
         
         # Connect search functionality
-        def perform_search():
+        def perform_search(typed=False):
+            search_timer.stop()
             keyword = keyword_input.text()
-            category = None if category_combo.currentText() == "All Categories" else category_combo.currentText()
-            tag = tag_input.text() if tag_input.text() else None
+            # Read each widget once, every call crosses into Qt
+            category = category_combo.currentText()
+            if category == "All Categories":
+                category = None
+            tag = tag_input.text() or None
             
             if not keyword:
-                QMessageBox.warning(dialog, "Error", "Please enter a search keyword!")
+                if typed:
+                    results_label.setText("Search Results:")
+                    results_model.set_rows([])
+                else:
+                    QMessageBox.warning(dialog, "Error", "Please enter a search keyword!")
                 return
             
             try:
-                results = self.password_manager.search_password(keyword, category, tag)
+                # Keep the category, the same service can be in several
+                categories = self.password_manager.passwords["categories"]
+                rows = [(cat, service, categories[cat][service]) for cat, service
+                        in self.password_manager.iter_search_keys(keyword, category, tag)]
+                results_model.set_rows(rows)
                 
-                if results:
-                    output = ""
-                    for service, info in results.items():
-                        output += f"Service: {service}\n"
-                        output += f"  Username: {info['username']}\n"
-                        output += f"  Password: {info['password']}\n"
-                        if 'tags' in info and info['tags']:
-                            output += f"  Tags: {', '.join(info['tags'])}\n"
-                        output += "\n"
-                    results_text.setText(output)
-                    self.output_text.setText(f"Found {len(results)} matching password(s)")
+                if rows:
+                    results_label.setText("Search Results:")
+                    self.show_output(f"Found {len(rows)} matching password(s)")
                 else:
-                    results_text.setText("No results found matching your criteria.")
-                    self.output_text.setText("No matching passwords found")
+                    results_label.setText("No results found matching your criteria.")
+                    self.show_output("No matching passwords found")
             except Exception as e:
                 QMessageBox.critical(dialog, "Error", f"An error occurred: {str(e)}")
         
-        search_btn.clicked.connect(perform_search)
+        # Search as the user types, but only once typing pauses so a burst
+        # of keystrokes runs one search instead of one per key
+        search_timer = QTimer(dialog)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(SEARCH_DELAY_MS)
+        search_timer.timeout.connect(lambda: perform_search(typed=True))
+        def restart_search(*_):
+            # Drop the signal's argument, start() would take it as the interval
+            search_timer.start()
+        
+        keyword_input.textChanged.connect(restart_search)
+        tag_input.textChanged.connect(restart_search)
+        category_combo.currentIndexChanged.connect(restart_search)
+        
+        search_btn.clicked.connect(lambda: perform_search())
         cancel_btn.clicked.connect(dialog.reject)
         
-        dialog.show()
+        def reset():
+            self._fill_category_combo(category_combo, include_all=True)
+            keyword_input.clear()
+            tag_input.clear()
+            search_timer.stop()
+            results_label.setText("Search Results:")
+            results_model.set_rows([])
         
-    def show_delete_password(self):
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Delete Password")
-        dialog.setGeometry(200, 200, 400, 220)
-        dialog.setStyleSheet("""
-        QDialog {
-            background-color: #1a1a1a;
-        }
-        QLabel {
-            color: white;
-            font-size: 11px;
-        }
-        QLineEdit, QComboBox {
-            background-color: #2d2d2d;
-            color: white;
-            border: 1px solid #3d3d3d;
-            border-radius: 3px;
-            padding: 4px;
-            font-size: 11px;
-        }
-        QPushButton {
-            background-color: #2d2d2d;
-            color: white;
-            border: 1px solid #42d4d4;
-            border-radius: 3px;
-            padding: 5px;
-            font-size: 11px;
-        }
-        QPushButton:hover {
-            background-color: #3d3d3d;
-            border: 1px solid #42d4d4;
-            color: #42d4d4;
-        }
-        """)
+        dialog.reset = reset
+        return dialog
         
-        layout = QVBoxLayout(dialog)
+    def _build_delete_password_dialog(self):
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Delete Passwords")
+        dialog.setGeometry(200, 200, 400, 360)
+        dialog.setObjectName(DIALOG_OBJECT_NAME)
+        layout = QFormLayout(dialog)
         layout.setSpacing(5)
         layout.setContentsMargins(10, 10, 10, 10)
-        
-        category_label = QLabel("Category (optional):")
+
         category_combo = QComboBox()
-        category_combo.addItem("All Categories")
-        for category in self.password_manager.get_categories():
-            category_combo.addItem(category)
-        
-        service_label = QLabel("Service Name:")
-        service_input = QLineEdit()
-        service_input.setPlaceholderText("Enter service name to delete")
-        
-        layout.addWidget(category_label)
-        layout.addWidget(category_combo)
-        layout.addWidget(service_label)
-        layout.addWidget(service_input)
-        
-        # Add warning label
+        layout.addRow(QLabel("Category (optional):"), category_combo)
+
+        filter_input = QLineEdit()
+        filter_input.setPlaceholderText("Filter services by name")
+        layout.addRow(QLabel("Service Name:"), filter_input)
+
+        # Several entries can be selected and deleted in one go
+        service_list = QListWidget()
+        service_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        layout.addRow(service_list)
+
         warning_label = QLabel("Warning: This action cannot be undone!")
-        warning_label.setStyleSheet("color: #ff5555; font-weight: bold;")
-        layout.addWidget(warning_label)
-        
+        warning_label.setObjectName("warningLabel")
+        layout.addRow(warning_label)
+
         button_layout = QHBoxLayout()
         delete_btn = QPushButton("Delete")
         cancel_btn = QPushButton("Cancel")
-        
-        def delete_action():
-            service = service_input.text()
-            category = None if category_combo.currentText() == "All Categories" else category_combo.currentText()
-            
-            if not service:
-                QMessageBox.warning(dialog, "Error", "Please enter a service name!")
-                return
-                
-            # Confirm deletion
-            confirm = QMessageBox.question(
-                dialog, "Confirm Deletion", 
-                f"Are you sure you want to delete password for '{service}'?", 
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if confirm == QMessageBox.Yes:
-                # Try to delete the password
-                try:
-                    success = self.password_manager.delete_password(service, category)
-                    if success:
-                        self.output_text.setText(f"Password deleted for service: {service}")
-                        dialog.accept()
-                    else:
-                        QMessageBox.warning(
-                            dialog, "Error", 
-                            f"Service '{service}' not found in the selected category!"
-                        )
-                except Exception as e:
-                    QMessageBox.critical(dialog, "Error", f"An error occurred: {str(e)}")
-        
-        delete_btn.clicked.connect(delete_action)
-        cancel_btn.clicked.connect(dialog.reject)
-        
         button_layout.addWidget(delete_btn)
         button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
-        
-        dialog.show()
-        
-    def show_update_password(self):
-        dialog = QWidget()
-        dialog.setWindowTitle("Update Password")
-        dialog.setGeometry(200, 200, 400, 300)
-        dialog.setStyleSheet("""
-        QWidget {
-            background-color: #1a1a1a;
-        }
-        QLabel {
-            color: white;
-            font-size: 11px;
-        }
-        QLineEdit, QComboBox {
-            background-color: #2d2d2d;
-            color: white;
-            border: 1px solid #3d3d3d;
-            border-radius: 3px;
-            padding: 4px;
-            font-size: 11px;
-        }
-        QLineEdit:focus, QComboBox:focus {
-            border: 1px solid #42d4d4;
-        }
-        QPushButton {
-            background-color: #2d2d2d;
-            color: white;
-            border: none;
-            padding: 5px;
-            border-radius: 3px;
-            font-weight: bold;
-            font-size: 11px;
-        }
-        QPushButton:hover {
-            background-color: #3d3d3d;
-            border: 1px solid #42d4d4;
-            color: #42d4d4;
-        }
-        QComboBox::drop-down {
-            border: 0px;
-        }
-        QComboBox QAbstractItemView {
-            background-color: #2d2d2d;
-            color: white;
-            selection-background-color: #3d3d3d;
-            selection-color: #42d4d4;
-        }
-    """)
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(5)
-        layout.setContentsMargins(10, 10, 10, 10)
-        
-        category_label = QLabel("Category (optional):")
-        category_combo = QComboBox()
-        category_combo.addItem("All Categories")
-        for category in self.password_manager.get_categories():
-            category_combo.addItem(category)
-        
-        service_label = QLabel("Service Name:")
-        service_input = QLineEdit()
-        service_input.setPlaceholderText("Enter service name")
-        
-        username_label = QLabel("New Username:")
-        username_input = QLineEdit()
-        username_input.setPlaceholderText("Enter new username")
-        
-        password_label = QLabel("New Password:")
-        password_input = QLineEdit()
-        password_input.setPlaceholderText("Enter new password")
-        password_input.setEchoMode(QLineEdit.Password)
-        
-        # Add tags field
-        tags_label = QLabel("Tags (comma separated):")
-        tags_input = QLineEdit()
-        tags_input.setPlaceholderText("e.g., work, personal, important")
-        
-        layout.addWidget(category_label)
-        layout.addWidget(category_combo)
-        layout.addWidget(service_label)
-        layout.addWidget(service_input)
-        layout.addWidget(username_label)
-        layout.addWidget(username_input)
-        layout.addWidget(password_label)
-        layout.addWidget(password_input)
-        layout.addWidget(tags_label)
-        layout.addWidget(tags_input)
-        
-        button_layout = QHBoxLayout()
-        update_btn = QPushButton("Update")
-        cancel_btn = QPushButton("Cancel")
+        layout.addRow(button_layout)
+
+        def fill_list():
+            filter_timer.stop()
+            category = category_combo.currentText()
+            show_category = category == "All Categories"
+            service_list.clear()
+            for cat, service in self.password_manager.iter_search_keys(
+                    filter_input.text(), None if show_category else category):
+                item = QListWidgetItem(f"{service} ({cat})" if show_category else service)
+                item.setData(Qt.UserRole, (cat, service))
+                service_list.addItem(item)
+
+        # Refill the list once typing in the filter pauses, not per keystroke
+        filter_timer = QTimer(dialog)
+        filter_timer.setSingleShot(True)
+        filter_timer.setInterval(SEARCH_DELAY_MS)
+        filter_timer.timeout.connect(fill_list)
+        filter_input.textChanged.connect(lambda *_: filter_timer.start())
+        category_combo.currentIndexChanged.connect(lambda *_: fill_list())
+        delete_btn.clicked.connect(lambda: self.delete_passwords(
+            [item.data(Qt.UserRole) for item in service_list.selectedItems()], dialog))
+        cancel_btn.clicked.connect(dialog.reject)
+
+        def reset():
+            # Fill the list once at the end rather than on every change
+            for widget in (category_combo, filter_input):
+                widget.blockSignals(True)
+            self._fill_category_combo(category_combo, include_all=True)
+            filter_input.clear()
+            for widget in (category_combo, filter_input):
+                widget.blockSignals(False)
+            fill_list()
+
+        dialog.reset = reset
+        return dialog
+
+    def delete_passwords(self, entries, dialog):
+        if not entries:
+            QMessageBox.warning(dialog, "Error", "Please select the services to delete!")
+            return
+            
+        # Confirm deletion
+        if len(entries) == 1:
+            question = f"Are you sure you want to delete password for '{entries[0][1]}'?"
+        else:
+            question = f"Are you sure you want to delete {len(entries)} passwords?"
+        confirm = QMessageBox.question(
+            dialog, "Confirm Deletion", question,
+            QMessageBox.Yes | QMessageBox.No
+        )
         
-        # Wrap update_password in try-except to prevent crashes
-        def safe_update():
+        if confirm == QMessageBox.Yes:
+            # Delete all selected entries, they are saved together
             try:
-                self.update_password(
-                    service_input.text(),
-                    username_input.text(),
-                    password_input.text(),
-                    None if category_combo.currentText() == "All Categories" else category_combo.currentText(),
-                    tags_input.text(),
-                    dialog
-                )
+                deleted = self.password_manager.delete_passwords(entries)
+                if not deleted:
+                    self.show_output("No passwords deleted, the selected services no longer exist.")
+                else:
+                    self.schedule_save()
+                    if len(entries) == 1:
+                        self.show_output(f"Password deleted for service: {entries[0][1]}")
+                    else:
+                        self.show_output(f"Deleted {deleted} passwords")
+                dialog.accept()
             except Exception as e:
                 QMessageBox.critical(dialog, "Error", f"An error occurred: {str(e)}")
-            
-        update_btn.clicked.connect(safe_update)
-        cancel_btn.clicked.connect(dialog.close)
-
-        button_layout.addWidget(update_btn)
-        button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
 
-        dialog.show()
+    def _build_update_password_dialog(self):
+        return self._build_form_dialog(
+            "Update Password", (400, 300),
+            [('service', "Service Name:", "Enter service name"),
+             ('username', "New Username:", "Enter new username"),
+             ('password', "New Password:", "Enter new password"),
+             ('tags', "Tags (comma separated):", "e.g., work, personal, important")],
+            "Update",
+            lambda values, category, dialog: self.update_password(
+                values['service'], values['username'], values['password'],
+                category, values['tags'], dialog),
+            complete_services=True)
 
     def update_password(self, service, username, password, category, tags, dialog):
         try:
@@ -1073,20 +997,18 @@ class PasswordManagerGUI(QMainWindow):
                 QMessageBox.warning(dialog, "Error", "Please fill all fields!")
                 return
             
-            # Process tags - split by comma and strip whitespace
-            tag_list = []
-            if tags:
-                tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
+            tag_list = parse_tags(tags)
             
             # Update the password with tags
             success = self.password_manager.update_password(service, username, password, category, tag_list)
+            self.schedule_save()
 
             if success:
                 # Show confirmation with tags if any were added
                 if tag_list:
-                    self.output_text.setText(f"Password updated for service: {service} (Category: {category if category else 'found'}, Tags: {', '.join(tag_list)})")
+                    self.show_output(f"Password updated for service: {service} (Category: {category if category else 'found'}, Tags: {', '.join(tag_list)})")
                 else:
-                    self.output_text.setText(f"Password updated for service: {service} (Category: {category if category else 'found'})")
+                    self.show_output(f"Password updated for service: {service} (Category: {category if category else 'found'})")
                 dialog.close()
             else:
                 QMessageBox.warning(dialog, "Error", f"Service '{service}' not found in the selected category!")
@@ -1102,11 +1024,15 @@ class PasswordManagerGUI(QMainWindow):
             "CSV Files (*.csv);;All Files (*)"
         )
         if file_path:
-            success = self.password_manager.import_passwords(file_path)
-            if success:
-                self.output_text.setText("Passwords imported successfully.")
-            else:
-                self.output_text.setText("Error importing passwords. Please check file format.")
+            def finished(success):
+                self.schedule_save()
+                if success:
+                    self.show_output("Passwords imported successfully.")
+                else:
+                    self.show_output("Error importing passwords. Please check file format.")
+
+            self.run_task("Importing passwords...", finished,
+                          self.password_manager.import_passwords, file_path)
             
     def export_passwords(self):
         file_path, _ = QFileDialog.getSaveFileName(self, "Save CSV File", "", "CSV Files (*.csv)")
@@ -1115,76 +1041,37 @@ class PasswordManagerGUI(QMainWindow):
             if not file_path.lower().endswith('.csv'):
                 file_path += '.csv'
                 
-            success = self.password_manager.export_passwords(file_path)
-            if success:
-                self.output_text.setText(f"Passwords exported to {file_path}")
-            else:
-                self.output_text.setText("Error exporting passwords.")
+            def finished(success):
+                if success:
+                    self.show_output(f"Passwords exported to {file_path}")
+                else:
+                    self.show_output("Error exporting passwords.")
+
+            self.run_task("Exporting passwords...", finished,
+                          self.password_manager.export_passwords, file_path)
                 
     def show_generate_password(self):
-        dialog = QWidget()
+        self._show_dialog('generate', self._build_generate_password_dialog)
+
+    def _build_generate_password_dialog(self):
+        dialog = QDialog(self)
         dialog.setWindowTitle("Generate Password")
         dialog.setGeometry(200, 200, 300, 120)
-        dialog.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: white;
-                font-size: 11px;
-            }
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 11px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #42d4d4;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: white;
-                border: none;
-                padding: 5px;
-                border-radius: 3px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #42d4d4;
-                color: #42d4d4;
-            }
-            QSpinBox {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 3px;
-                padding: 4px;
-                font-size: 11px;
-            }
-        """)
-        layout = QVBoxLayout(dialog)
+        dialog.setObjectName(DIALOG_OBJECT_NAME)
+        layout = QFormLayout(dialog)
         layout.setSpacing(5)
         layout.setContentsMargins(10, 10, 10, 10)
         
-
-        length_layout = QHBoxLayout()
         length_label = QLabel("Password Length:")
         length_spin = QSpinBox()
         length_spin.setRange(8, 32)
         length_spin.setValue(12)
-        length_layout.addWidget(length_label)
-        length_layout.addWidget(length_spin)
-        layout.addLayout(length_layout)
+        layout.addRow(length_label, length_spin)
 
         password_display = QLineEdit()
         password_display.setReadOnly(True)
         password_display.setPlaceholderText("Generated password will appear here")
-        layout.addWidget(password_display)
+        layout.addRow(password_display)
         
         button_layout = QHBoxLayout()
         generate_btn = QPushButton("Generate")
@@ -1196,9 +1083,14 @@ class PasswordManagerGUI(QMainWindow):
             password_display.setText(password)
             
         def copy():
-            if password_display.text():
-                QApplication.clipboard().setText(password_display.text())
-                QMessageBox.information(dialog, "Success", "Password copied to clipboard!")
+            password = password_display.text()
+            if password:
+                self.copy_to_clipboard(password)
+                # Confirm on the button instead of with a modal message box
+                copy_btn.setText("Copied!")
+                QTimer.singleShot(COPIED_FEEDBACK_MS, lambda: copy_btn.setText("Copy"))
+                self.show_output("Password copied to clipboard, it is cleared after "
+                                 f"{CLIPBOARD_CLEAR_MS // 1000} seconds.")
                 
         generate_btn.clicked.connect(generate)
         copy_btn.clicked.connect(copy)
@@ -1207,31 +1099,58 @@ class PasswordManagerGUI(QMainWindow):
         button_layout.addWidget(generate_btn)
         button_layout.addWidget(copy_btn)
         button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
+        layout.addRow(button_layout)
+        
+        def reset():
+            length_spin.setValue(12)
+            password_display.clear()
+            copy_btn.setText("Copy")
         
-        dialog.show()
+        dialog.reset = reset
+        return dialog
 
     def show_all_passwords(self):
-        output = "All Passwords by Category:\n\n"
-        
+        if not self.password_manager.count_passwords():
+            self.show_output("All Passwords by Category:\n\nNo passwords stored.")
+            return
+        # The listing is appended in batches from the event loop, so the first
+        # entries show up at once and the window stays responsive
+        self.show_output("All Passwords by Category:")
+        self._listing = self._iter_listing_batches()
+        self._pump_listing()
+
+    def _iter_listing_batches(self):
+        """Yield the listing text in batches of at most LISTING_BATCH entries"""
+        categories = self.password_manager.passwords["categories"]
         for category in self.password_manager.get_categories():
-            category_passwords = self.password_manager.passwords["categories"][category]
-            if category_passwords:
-                output += f"Category: {category}\n"
-                output += "-" * 40 + "\n"
-                
-                for service, creds in category_passwords.items():
-                    output += f"Service: {service}\n"
-                    output += f"Username: {creds['username']}\n"
-                    output += f"Password: {creds['password']}\n"
-                    output += "-" * 30 + "\n"
-                
-                output += "\n"
-        
-        if output == "All Passwords by Category:\n\n":
-            output += "No passwords stored."
-        
-        self.output_text.setText(output)
+            category_passwords = categories[category]
+            if not category_passwords:
+                continue
+            entries = iter(category_passwords.items())
+            header = f"\nCategory: {category}\n{CATEGORY_SEPARATOR}\n"
+            while True:
+                batch = "\n".join(
+                    f"Service: {service}\n"
+                    f"Username: {creds['username']}\n"
+                    f"Password: {creds['password']}\n"
+                    f"{ENTRY_SEPARATOR}"
+                    for service, creds in islice(entries, LISTING_BATCH)
+                )
+                if not batch:
+                    break
+                yield header + batch
+                header = ""
+
+    def _pump_listing(self):
+        """Append the next batch of the listing and schedule the one after"""
+        if self._listing is None:
+            return
+        batch = next(self._listing, None)
+        if batch is None:
+            self._listing = None
+            return
+        self.output_text.appendPlainText(batch)
+        QTimer.singleShot(0, self._pump_listing)
     
     def check_password_strength(self, password):
         """Evaluate the strength of a password"""
@@ -1246,33 +1165,46 @@ class PasswordManagerGUI(QMainWindow):
         else:
             score += 10
         
+        # Classify the characters in one pass instead of one pass per class
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            # Not part of the chain, some cased characters such as circled
+            # letters aren't alphanumeric either and count as both
+            if not c.isalnum():
+                has_special = True
+        
         # Check for uppercase letters
-        if any(c.isupper() for c in password):
+        if has_upper:
             score += 10
         else:
             feedback.append("Add uppercase letters")
         
         # Check for lowercase letters
-        if any(c.islower() for c in password):
+        if has_lower:
             score += 10
         else:
             feedback.append("Add lowercase letters")
         
         # Check for digits
-        if any(c.isdigit() for c in password):
+        if has_digit:
             score += 10
         else:
             feedback.append("Add numbers")
         
         # Check for special characters
-        if any(not c.isalnum() for c in password):
+        if has_special:
             score += 15
         else:
             feedback.append("Add special characters")
         
         # Check for common patterns
-        common_patterns = ['123456', 'password', 'qwerty', 'admin']
-        if any(pattern in password.lower() for pattern in common_patterns):
+        if COMMON_PATTERN_RE.search(password.lower()):
             score -= 20
             feedback.append("Avoid common patterns")
         
@@ -1302,37 +1234,14 @@ class PasswordManagerGUI(QMainWindow):
     
     def show_security_check(self):
         """Show a separate security check dialog window"""
+        self._show_dialog('security', self._build_security_check_dialog)
+
+    def _build_security_check_dialog(self):
         # Create a proper dialog window
         dialog = QDialog(self)
         dialog.setWindowTitle("Password Security Check")
         dialog.setFixedSize(450, 400)
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: white;
-            }
-            QLineEdit {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 6px;
-            }
-            QPushButton {
-                background-color: #2d2d2d;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #42d4d4;
-                color: #42d4d4;
-            }
-        """)
+        dialog.setObjectName("securityDialog")
         
         # Main layout
         layout = QVBoxLayout(dialog)
@@ -1341,7 +1250,7 @@ class PasswordManagerGUI(QMainWindow):
         
         # Title
         title_label = QLabel("Password Security Checker")
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: white; margin-bottom: 10px;")
+        title_label.setObjectName("securityTitle")
         layout.addWidget(title_label)
         
         # Instructions
@@ -1364,7 +1273,7 @@ class PasswordManagerGUI(QMainWindow):
         
         # Strength meter container
         meter_container = QFrame()
-        meter_container.setStyleSheet("background-color: #2d2d2d; border-radius: 4px;")
+        meter_container.setObjectName("strengthMeter")
         meter_container.setFixedHeight(20)
         meter_layout = QHBoxLayout(meter_container)
         meter_layout.setContentsMargins(2, 2, 2, 2)
@@ -1372,23 +1281,16 @@ class PasswordManagerGUI(QMainWindow):
         
         # Strength bar
         strength_bar = QFrame()
-        strength_bar.setFixedWidth(0)  # Initially empty
-        strength_bar.setStyleSheet("background-color: #666; border-radius: 2px;")
+        strength_bar.setObjectName("strengthBar")
         meter_layout.addWidget(strength_bar)
         meter_layout.addStretch()
         
         layout.addWidget(meter_container)
         
         # Results area
-        result_label = QLabel("Results will appear here")
+        result_label = QLabel()
+        result_label.setObjectName("securityResult")
         result_label.setWordWrap(True)
-        result_label.setStyleSheet("""
-            background-color: #2d2d2d;
-            color: white;
-            padding: 15px;
-            border-radius: 4px;
-            min-height: 80px;
-        """)
         layout.addWidget(result_label)
         
         # Buttons
@@ -1418,32 +1320,39 @@ class PasswordManagerGUI(QMainWindow):
             # Get password strength
             score, feedback, color = self.check_password_strength(password)
             
-            # Update result text
+            # Update result text, only the strength colour is set here, the
+            # rest of the look comes from SECURITY_DIALOG_STYLE
             result_label.setText(feedback)
-            result_label.setStyleSheet(f"""
-                background-color: #2d2d2d;
-                color: {color};
-                padding: 15px;
-                border-radius: 4px;
-                min-height: 80px;
-            """)
+            result_label.setStyleSheet(f"color: {color};")
             
             # Update strength bar
             bar_width = int((meter_container.width() - 4) * score / 100)
             strength_bar.setFixedWidth(max(bar_width, 4))  # At least 4px wide
-            strength_bar.setStyleSheet(f"background-color: {color}; border-radius: 2px;")
+            strength_bar.setStyleSheet(f"background-color: {color};")
         
         # Connect signals
         show_hide_btn.clicked.connect(toggle_password_visibility)
         check_btn.clicked.connect(check_security)
         close_btn.clicked.connect(dialog.accept)
         
-        # Show the dialog
-        dialog.exec_()
+        def reset():
+            password_input.clear()
+            password_input.setEchoMode(QLineEdit.Password)
+            show_hide_btn.setText("Show Password")
+            result_label.setText("Results will appear here")
+            # Drop the strength colours, back to the application style
+            result_label.setStyleSheet("")
+            strength_bar.setFixedWidth(0)  # Initially empty
+            strength_bar.setStyleSheet("")
+        
+        dialog.reset = reset
+        return dialog
 
 def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
+    # Parsed once here and inherited by the main window and every dialog
+    app.setStyleSheet(STYLE_SHEET)
     
     # Try to handle platform-specific settings
     if sys.platform.startswith('linux'):
@@ -0,0 +1,728 @@
+"""Vault storage for the Securonis password manager
+
+This module has no Qt dependency, so scripts can import and export
+passwords without loading the GUI toolkit.
+"""
+import os
+import json
+import csv
+import secrets
+import string
+import base64
+import hashlib
+import mmap
+import zlib
+import threading
+import atexit
+import weakref
+from contextlib import contextmanager
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, the standard library json module is used without it
+    orjson = None
+
+# Vault files start with a 4 byte header, followed by a 12 byte nonce and the
+# AES-GCM ciphertext. SPM2 vaults compress the JSON with zlib before it is
+# encrypted, SPM1 vaults don't. Files without a header are legacy Fernet tokens.
+VAULT_MAGIC = b'SPM2'
+VAULT_MAGIC_UNCOMPRESSED = b'SPM1'
+MAGIC_SIZE = 4
+NONCE_SIZE = 12
+
+# The vault JSON is very repetitive, the fastest zlib level already
+# shrinks it several times over
+COMPRESSION_LEVEL = 1
+
+# Per-user directory holding the key file and the default vault.
+# Use cross-platform path for both Windows and Linux
+CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.passmanager')
+
+# Searches across the whole vault use the trigram and tag indexes from this
+# many entries on, smaller vaults are faster to scan directly
+SEARCH_INDEX_MIN_ENTRIES = 500
+
+# I/O buffer size for CSV import and export
+CSV_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def dump_json(data):
+    """Serialize data to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def load_json(data):
+    """Parse UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def vault_digest(plaintext):
+    """Return a short fingerprint of serialized vault contents"""
+    # Only used to detect unchanged data, so a 128-bit BLAKE2b is plenty
+    return hashlib.blake2b(plaintext, digest_size=16).digest()
+
+
+# Managers with autosave off that are still open. Only weak references are
+# kept, so registering doesn't keep a manager and its passwords alive.
+_deferred_managers = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_deferred_managers():
+    """Write pending changes of open managers with autosave off at exit"""
+    for manager in list(_deferred_managers):
+        try:
+            manager.flush()
+        except Exception as e:
+            print(f"Error saving passwords: {e}")
+
+
+class PasswordManager:
+    # Key file contents per path, validated by the file's modification time
+    # and size, and the AES-GCM cipher for each key, so repeated instances
+    # skip reading and setting up
+    _key_cache = {}
+    _aead_cache = {}
+
+    # Characters used by generate_password. The mask is the smallest all-ones
+    # bit mask covering the alphabet, masked values past the end of the
+    # alphabet are rejected so every character stays equally likely.
+    _ALPHABET = (string.ascii_letters + string.digits + string.punctuation).encode('ascii')
+    _ALPHABET_SIZE = len(_ALPHABET)
+    _ALPHABET_MASK = (1 << _ALPHABET_SIZE.bit_length()) - 1
+
+    def __init__(self, file_path=None, autosave=True):
+        if file_path is None:
+            file_path = os.path.join(CONFIG_DIR, 'passwords.json')
+        self.file_path = file_path
+        # When autosave is off, mutations only mark the vault dirty and the
+        # caller is responsible for calling flush(), close() or writing snapshots
+        self._autosave = autosave
+        self._dirty = False
+        # Nesting depth of with blocks; saves are deferred while it is nonzero
+        self._batch_depth = 0
+        # Digest of the plaintext currently on disk, used to skip no-op saves
+        self._saved_digest = None
+        # Snapshots are numbered so a stale one is never written over a newer one
+        self._snapshot_generation = 0
+        self._written_generation = 0
+        self._write_lock = threading.Lock()
+        self.key = self.load_key()
+        self.aead = PasswordManager._aead_cache.get(self.key)
+        if self.aead is None:
+            # The key file holds a urlsafe base64 encoded 256-bit key
+            self.aead = AESGCM(base64.urlsafe_b64decode(self.key))
+            PasswordManager._aead_cache[self.key] = self.aead
+        self.passwords = self.load_passwords()
+        # Default categories with meaningful names
+        self.categories = ["Internet", "Gaming", "Coding", "Shopping", "Social", "Computer", "World"]
+        # Setting up a new vault, migrating it and rewriting legacy Fernet
+        # vaults in the current format all end in a single save
+        with self.batch():
+            if "categories" not in self.passwords:
+                self.passwords["categories"] = {}
+                for category in self.categories:
+                    self.passwords["categories"][category] = {}
+                self._changed()
+            
+            # Check if migration is needed
+            self.check_and_migrate_categories()
+        self._rebuild_index()
+        if not autosave:
+            # Don't lose deferred changes if the owner never flushes: they
+            # are written when the manager is collected (__del__) or, if it
+            # is still alive then, at exit
+            _deferred_managers.add(self)
+
+    def load_key(self):
+        key_path = os.path.join(CONFIG_DIR, 'secret.key')
+        if os.path.exists(key_path):
+            stat = os.stat(key_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = PasswordManager._key_cache.get(key_path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            with open(key_path, 'rb') as key_file:
+                key = key_file.read()
+            PasswordManager._key_cache[key_path] = (version, key)
+            return key
+        else:
+            os.makedirs(CONFIG_DIR, mode=0o700, exist_ok=True)
+            key = Fernet.generate_key()
+            with open(key_path, 'wb') as key_file:
+                key_file.write(key)
+            # Use platform-neutral way to set permissions
+            try:
+                os.chmod(key_path, 0o600)  # Set permissions to read/write for owner only
+            except Exception:
+                # On Windows, chmod doesn't fully work, but it's OK
+                pass
+            return key
+
+    def load_passwords(self):
+        if os.path.exists(self.file_path):
+            with open(self.file_path, 'rb') as file:
+                if hasattr(os, 'posix_fadvise'):
+                    # The file is read once from front to back
+                    os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                # Decrypt straight from the mapped file instead of copying it into a bytes object
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    magic = mapped[:MAGIC_SIZE]
+                    if magic in (VAULT_MAGIC, VAULT_MAGIC_UNCOMPRESSED):
+                        header_size = MAGIC_SIZE + NONCE_SIZE
+                        with memoryview(mapped) as view:
+                            decrypted_data = self.aead.decrypt(
+                                view[MAGIC_SIZE:header_size], view[header_size:], magic)
+                        if magic == VAULT_MAGIC:
+                            decrypted_data = zlib.decompress(decrypted_data)
+                        legacy = False
+                    else:
+                        # Vault written by an older version, save it again in the new format
+                        decrypted_data = Fernet(self.key).decrypt(bytes(mapped))
+                        legacy = True
+            if legacy:
+                self._dirty = True
+            else:
+                self._saved_digest = vault_digest(decrypted_data)
+            return load_json(decrypted_data)
+        return {}
+
+    def save_passwords(self):
+        self.write_snapshot(self.take_snapshot())
+
+    def take_snapshot(self):
+        """Serialize the vault for write_snapshot and clear the dirty flag
+        
+        Snapshots are cheap to take, the expensive encryption and disk
+        write happen in write_snapshot, which may run on another thread.
+        """
+        self._snapshot_generation += 1
+        self._dirty = False
+        return self._snapshot_generation, dump_json(self.passwords)
+
+    def write_snapshot(self, snapshot):
+        """Encrypt a snapshot taken by take_snapshot and write it to disk
+        
+        If the write fails the vault is marked dirty again, so the next
+        save retries the changes instead of dropping them.
+        """
+        try:
+            self._write_snapshot(snapshot)
+        except BaseException:
+            self._dirty = True
+            raise
+
+    def _write_snapshot(self, snapshot):
+        generation, plaintext = snapshot
+        with self._write_lock:
+            if generation <= self._written_generation:
+                # A newer snapshot has already been written
+                return
+            digest = vault_digest(plaintext)
+            if digest == self._saved_digest and os.path.exists(self.file_path):
+                # Nothing changed since the vault was last loaded or saved
+                self._written_generation = generation
+                return
+            nonce = os.urandom(NONCE_SIZE)
+            ciphertext = self.aead.encrypt(
+                nonce, zlib.compress(plaintext, COMPRESSION_LEVEL), VAULT_MAGIC)
+            encrypted_data = VAULT_MAGIC + nonce + ciphertext
+            # Write to a temporary file and rename it over the vault, so a crash
+            # mid-write can't leave a truncated vault behind
+            tmp_path = self.file_path + '.tmp'
+            # Create the file readable by its owner only, it is never visible
+            # with looser permissions, not even while it is being written
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            try:
+                fd = os.open(tmp_path, flags, 0o600)
+            except FileNotFoundError:
+                # Only the first save into a new directory gets here
+                os.makedirs(os.path.dirname(self.file_path), mode=0o700, exist_ok=True)
+                fd = os.open(tmp_path, flags, 0o600)
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(encrypted_data)
+                    file.flush()
+                    # Make sure the data is on disk before the rename publishes it
+                    os.fsync(file.fileno())
+                # O_CREAT doesn't change the mode of a leftover temp file
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self.file_path)
+            except BaseException:
+                # Don't leave a partial copy of the vault behind
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._saved_digest = digest
+            self._written_generation = generation
+
+    def flush(self):
+        """Write pending changes to disk if there are any"""
+        if self._dirty:
+            self.save_passwords()
+
+    def close(self):
+        """Write pending changes and stop flushing this manager at exit"""
+        self.flush()
+        _deferred_managers.discard(self)
+
+    def __del__(self):
+        # A manager with autosave off that is dropped without close() still
+        # writes what it deferred
+        # getattr because __init__ may have failed before setting _dirty
+        if not getattr(self, '_dirty', False):
+            return
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"Error saving passwords: {e}")
+
+    def take_pending_snapshot(self):
+        """Return a snapshot of unsaved changes, or None if there are none"""
+        if self._dirty:
+            return self.take_snapshot()
+        return None
+
+    def __enter__(self):
+        """Batch mutations and save them once when the block ends
+
+        with PasswordManager() as pm:
+            for service, username, password in rows:
+                pm.add_password(service, username, password)
+        """
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()
+        return False
+
+    @contextmanager
+    def batch(self):
+        """Defer saving until the block ends, like using the manager in a with block"""
+        with self:
+            yield self
+
+    def _changed(self):
+        """Persist a mutation now, or defer it when autosave is disabled"""
+        if self._autosave and not self._batch_depth:
+            self.save_passwords()
+        else:
+            self._dirty = True
+
+    def _rebuild_index(self):
+        """Rebuild the in-memory lookup tables from the loaded vault"""
+        # Case-folded service names keyed by (category, service), so searches
+        # don't have to case-fold every stored name on each query. Searches
+        # walk it in vault order, see _ordered_names()
+        self._lower_names = {}
+        self._names_in_order = True
+        self._categories_cache = None
+        # Categories holding each service name, so lookups without a
+        # category don't have to scan the whole vault
+        self._service_index = {}
+        # Case-folded tags of each entry, for tag filters in searches
+        self._lower_tags = {}
+        # Trigram index of the case-folded names, built by the first search
+        # that needs it and dropped whenever an entry is added or removed
+        self._trigrams = None
+        # Same for the entries holding each tag, dropped on every change
+        self._tags = None
+        for category, services in self.passwords["categories"].items():
+            for service, entry in services.items():
+                self._lower_names[(category, service)] = service.casefold()
+                self._lower_tags[(category, service)] = self._tag_set(entry)
+                self._service_index.setdefault(service, []).append(category)
+
+    @staticmethod
+    def _tag_set(entry):
+        """Return the case-folded tags of an entry as a set"""
+        return frozenset(tag.casefold() for tag in entry.get('tags') or ())
+
+    def _find_category(self, service):
+        """Return the first category holding service, or None"""
+        categories = self._service_index.get(service)
+        if not categories:
+            return None
+        if len(categories) == 1:
+            return categories[0]
+        # The same name lives in several categories; keep the vault order
+        for category in self.passwords["categories"]:
+            if category in categories:
+                return category
+        return None
+
+    def _put_entry(self, category, service, entry):
+        """Store an entry and keep the lookup tables in sync"""
+        if category not in self.passwords["categories"]:
+            self.passwords["categories"][category] = {}
+            self._categories_cache = None
+        categories = self.passwords["categories"]
+        services = categories[category]
+        if service not in services:
+            self._service_index.setdefault(service, []).append(category)
+            self._trigrams = None
+            if category != next(reversed(categories)):
+                # The new name lands at the end of _lower_names, but not at
+                # the end of the vault
+                self._names_in_order = False
+        services[service] = entry
+        self._lower_names[(category, service)] = service.casefold()
+        self._lower_tags[(category, service)] = self._tag_set(entry)
+        self._tags = None
+
+    def _remove_entry(self, category, service):
+        """Remove an entry and keep the lookup tables in sync"""
+        del self.passwords["categories"][category][service]
+        self._lower_names.pop((category, service), None)
+        self._lower_tags.pop((category, service), None)
+        self._trigrams = None
+        self._tags = None
+        categories = self._service_index.get(service)
+        if categories:
+            categories.remove(category)
+            if not categories:
+                del self._service_index[service]
+
+    def check_and_migrate_categories(self):
+        """Check if categories need migration and migrate them"""
+        # Old and new categories
+        old_categories = ["1", "2", "3", "4"]
+        
+        # Check if migration is needed
+        needs_migration = False
+        for old_cat in old_categories:
+            if old_cat in self.passwords["categories"]:
+                needs_migration = True
+                break
+        
+        if needs_migration:
+            self.migrate_categories()
+    
+    def migrate_categories(self):
+        """Migrate old numeric categories to new named ones"""
+        old_categories = ["1", "2", "3", "4"]
+        new_categories = ["Internet", "Gaming", "Coding", "Shopping", "Social", "Computer", "World"]
+        
+        # First make sure all new categories exist
+        for new_cat in new_categories:
+            if new_cat not in self.passwords["categories"]:
+                self.passwords["categories"][new_cat] = {}
+        
+        # Copy data from old categories to new ones if old categories exist
+        for i, old_cat in enumerate(old_categories):
+            if old_cat in self.passwords["categories"] and i < len(new_categories):
+                new_cat = new_categories[i]
+                # Copy passwords from old category to new category
+                for service, data in self.passwords["categories"][old_cat].items():
+                    self.passwords["categories"][new_cat][service] = data
+                # Remove old category using pop to avoid KeyError if not present
+                self.passwords["categories"].pop(old_cat, None)
+        
+        self._changed()
+
+    def add_password(self, service, username, password, category="Internet", tags=None):
+        # Initialize tags if not provided
+        if tags is None:
+            tags = []
+        
+        self._put_entry(category, service, {
+            'username': username, 
+            'password': password,
+            'tags': tags
+        })
+        self._changed()
+
+    def get_password(self, service, category=None):
+        if category:
+            if category in self.passwords["categories"] and service in self.passwords["categories"][category]:
+                return self.passwords["categories"][category][service]
+        else:
+            cat = self._find_category(service)
+            if cat is not None:
+                return self.passwords["categories"][cat][service]
+        return None
+
+    def update_password(self, service, username, password, category=None, tags=None):
+        # Preserve existing tags if not provided
+        existing_tags = []
+        
+        if category:
+            if category in self.passwords["categories"] and service in self.passwords["categories"][category]:
+                # Keep existing tags if not provided
+                if tags is None and 'tags' in self.passwords["categories"][category][service]:
+                    existing_tags = self.passwords["categories"][category][service]['tags']
+                
+                self._put_entry(category, service, {
+                    'username': username, 
+                    'password': password,
+                    'tags': tags if tags is not None else existing_tags
+                })
+                self._changed()
+                return True
+        else:
+            cat = self._find_category(service)
+            if cat is not None:
+                services = self.passwords["categories"][cat]
+                # Keep existing tags if not provided
+                if tags is None and 'tags' in services[service]:
+                    existing_tags = services[service]['tags']
+                
+                self._put_entry(cat, service, {
+                    'username': username, 
+                    'password': password,
+                    'tags': tags if tags is not None else existing_tags
+                })
+                self._changed()
+                return True
+        return False
+
+    def delete_password(self, service, category=None):
+        """Delete a password entry
+        
+        Args:
+            service: The service name to delete
+            category: The category containing the service, or None to search all categories
+            
+        Returns:
+            True if deletion was successful, False otherwise
+        """
+        if category:
+            # Delete from specific category
+            if category in self.passwords["categories"] and service in self.passwords["categories"][category]:
+                self._remove_entry(category, service)
+                self._changed()
+                return True
+        else:
+            cat = self._find_category(service)
+            if cat is not None:
+                self._remove_entry(cat, service)
+                self._changed()
+                return True
+        return False
+
+    def delete_passwords(self, entries):
+        """Delete several password entries with a single save
+        
+        Args:
+            entries: Iterable of (category, service) pairs to delete
+            
+        Returns:
+            The number of entries deleted, missing ones are skipped
+        """
+        categories = self.passwords["categories"]
+        deleted = 0
+        for category, service in entries:
+            if service in categories.get(category, ()):
+                self._remove_entry(category, service)
+                deleted += 1
+        if deleted:
+            self._changed()
+        return deleted
+
+    def iter_search(self, keyword, category=None, tag=None):
+        """Yield (service, credentials) pairs matching a search lazily
+        
+        Args:
+            keyword: Case-insensitive substring of the service name
+            category: Category to search in, or None to search all categories
+            tag: Tag the entry must have (case-insensitive), or None
+        """
+        categories = self.passwords["categories"]
+        for cat, service in self.iter_search_keys(keyword, category, tag):
+            yield service, categories[cat][service]
+
+    def iter_search_keys(self, keyword, category=None, tag=None):
+        """Yield the (category, service) pairs matching a search lazily
+        
+        Takes the same arguments as iter_search().
+        """
+        categories = self.passwords["categories"]
+        lower_names = self._lower_names
+        lower_tags = self._lower_tags
+        keyword = keyword.casefold()
+        if tag:
+            tag = tag.casefold()
+        if category:
+            candidates = [((category, service), lower_names[(category, service)])
+                          for service in categories.get(category, {})]
+        elif len(lower_names) >= SEARCH_INDEX_MIN_ENTRIES and (tag or len(keyword) >= 3):
+            # Only entries with the tag and with every trigram of the keyword
+            # in their name can match, so scan the shortest posting list
+            # instead of the whole vault
+            postings = []
+            if tag:
+                postings.append(self._tag_index().get(tag))
+            if len(keyword) >= 3:
+                trigrams = self._trigram_index()
+                postings.extend(trigrams.get(keyword[i:i + 3]) for i in range(len(keyword) - 2))
+            if not all(postings):
+                return
+            candidates = ((key, lower_names[key]) for key in min(postings, key=len))
+        else:
+            # Search in all categories, in vault order so results don't
+            # depend on the order entries were added in this session
+            candidates = self._ordered_names().items()
+        
+        if not tag:
+            # Keyword only, the common case, needs no tag lookup per entry
+            for key, lower_name in candidates:
+                if keyword in lower_name:
+                    yield key
+            return
+        
+        for key, lower_name in candidates:
+            # Check if the keyword matches the service name and the entry has the tag
+            if keyword in lower_name and tag in lower_tags[key]:
+                yield key
+
+    def _ordered_names(self):
+        """Return the case-folded names keyed by (category, service) in vault order"""
+        if not self._names_in_order:
+            # Entries added since the last search were appended at the end,
+            # put them back where the vault has them
+            lower_names = self._lower_names
+            self._lower_names = {
+                (category, service): lower_names[(category, service)]
+                for category, services in self.passwords["categories"].items()
+                for service in services}
+            self._names_in_order = True
+        return self._lower_names
+
+    def _trigram_index(self):
+        """Return the trigram index of service names, building it after changes"""
+        if self._trigrams is None:
+            # Posting lists are dicts so matches keep the vault order
+            trigrams = {}
+            for key, name in self._ordered_names().items():
+                for i in range(len(name) - 2):
+                    trigrams.setdefault(name[i:i + 3], {})[key] = None
+            self._trigrams = trigrams
+        return self._trigrams
+
+    def _tag_index(self):
+        """Return the entries holding each case-folded tag, building it after changes"""
+        if self._tags is None:
+            tags = {}
+            lower_tags = self._lower_tags
+            for key in self._ordered_names():
+                for tag in lower_tags[key]:
+                    tags.setdefault(tag, {})[key] = None
+            self._tags = tags
+        return self._tags
+
+    def search_password(self, keyword, category=None, tag=None):
+        return dict(self.iter_search(keyword, category, tag))
+
+    def count_passwords(self):
+        """Return the number of stored entries across all categories"""
+        # The case-folded name index holds exactly one key per entry
+        return len(self._lower_names)
+
+    def get_categories(self):
+        # Built once and reused until a category is added. Callers get their
+        # own list, so changing it can't corrupt the cache
+        if self._categories_cache is None:
+            self._categories_cache = tuple(self.passwords["categories"])
+        return list(self._categories_cache)
+
+    def list_services(self, category=None):
+        """Return the service names in a category, or in all categories without duplicates"""
+        if category:
+            return list(self.passwords["categories"].get(category, ()))
+        # Vault order, like searches, rather than the order names were first added
+        return list(dict.fromkeys(service for _, service in self._ordered_names()))
+
+    def import_passwords(self, csv_file):
+        imported = False
+        try:
+            try:
+                # Large buffer so big files are read in few syscalls
+                with open(csv_file, 'r', newline='', encoding='utf-8-sig', buffering=CSV_BUFFER_SIZE) as file:
+                    reader = csv.reader(file)
+                    header = next(reader, None)
+                    if header is None:
+                        return True
+                    # Resolve column positions once instead of building a dict per row
+                    service_col = header.index('service')
+                    username_col = header.index('username')
+                    password_col = header.index('password')
+                    category_col = header.index('category') if 'category' in header else None
+                    for row in reader:
+                        if not row:
+                            continue
+                        # Default to category 1 if not specified
+                        category = row[category_col] if category_col is not None else '1'
+                        self._put_entry(category, row[service_col], {
+                            'username': row[username_col],
+                            'password': row[password_col],
+                            'tags': []
+                        })
+                        imported = True
+            finally:
+                # Encrypt and write the vault once for the whole file
+                if imported:
+                    self._changed()
+            return True
+        except Exception as e:
+            print(f"Error importing passwords: {e}")
+            return False
+
+    def export_passwords(self, csv_file):
+        try:
+            with open(csv_file, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER_SIZE) as file:
+                writer = csv.writer(file)
+                writer.writerow(('category', 'service', 'username', 'password'))
+                # Plain tuples through writerows keep the per-row loop in C
+                writer.writerows(
+                    (category, service, creds['username'], creds['password'])
+                    for category, services in self.passwords["categories"].items()
+                    for service, creds in services.items()
+                )
+            return True
+        except Exception as e:
+            print(f"Error exporting passwords: {e}")
+            return False
+
+    def generate_password(self, length=12):
+        return self._random_characters(length)
+
+    def generate_passwords(self, count, length=12):
+        """Generate several passwords from one bulk draw of random bytes
+        
+        Args:
+            count: Number of passwords to generate
+            length: Length of each password
+            
+        Returns:
+            A list of count passwords
+        """
+        if length <= 0:
+            # Like generate_password, which returns '' for these lengths
+            return [''] * count
+        characters = self._random_characters(count * length)
+        return [characters[start:start + length] for start in range(0, count * length, length)]
+
+    def _random_characters(self, length):
+        """Return length uniformly chosen characters from the password alphabet"""
+        characters = self._ALPHABET
+        alphabet_size = self._ALPHABET_SIZE
+        mask = self._ALPHABET_MASK
+        password = bytearray()
+        while len(password) < length:
+            # Draw random bytes in bulk instead of one CSPRNG call per character
+            for byte in secrets.token_bytes(length * 2):
+                index = byte & mask
+                if index < alphabet_size:
+                    password.append(characters[index])
+        return password[:length].decode('ascii')